@@ -6,6 +6,7 @@
 import { db } from "@/lib/db/client";
 import { industries } from "@/lib/db/schema";
 import { successResponse, ApiErrors } from "@/lib/api/response";
+import { cached, REFERENCE_DATA_TTL } from "@/lib/cache";
 
 /**
  * GET /api/industries
@@ -13,13 +14,15 @@ import { successResponse, ApiErrors } from "@/lib/api/response";
  */
 export async function GET() {
   try {
-    const result = await db.select().from(industries).orderBy(industries.sortOrder);
+    const data = await cached("industries", REFERENCE_DATA_TTL, async () => {
+      const result = await db.select().from(industries).orderBy(industries.sortOrder);
 
-    const data = result.map((ind) => ({
-      code: ind.code,
-      name: ind.name,
-      description: ind.description,
-    }));
+      return result.map((ind) => ({
+        code: ind.code,
+        name: ind.name,
+        description: ind.description,
+      }));
+    });
 
     return successResponse(data);
   } catch (error) {
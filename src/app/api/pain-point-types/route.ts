@@ -6,6 +6,7 @@
 import { db } from "@/lib/db/client";
 import { painPointTypes } from "@/lib/db/schema";
 import { successResponse, ApiErrors } from "@/lib/api/response";
+import { cached, REFERENCE_DATA_TTL } from "@/lib/cache";
 
 /**
  * GET /api/pain-point-types
@@ -13,13 +14,15 @@ import { successResponse, ApiErrors } from "@/lib/api/response";
  */
 export async function GET() {
   try {
-    const result = await db.select().from(painPointTypes).orderBy(painPointTypes.sortOrder);
+    const data = await cached("pain-point-types", REFERENCE_DATA_TTL, async () => {
+      const result = await db.select().from(painPointTypes).orderBy(painPointTypes.sortOrder);
 
-    const data = result.map((type) => ({
-      code: type.code,
-      name: type.name,
-      description: type.description,
-    }));
+      return result.map((type) => ({
+        code: type.code,
+        name: type.name,
+        description: type.description,
+      }));
+    });
 
     return successResponse(data);
   } catch (error) {
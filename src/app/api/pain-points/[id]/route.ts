@@ -4,7 +4,7 @@
  */
 
 import { NextRequest } from "next/server";
-import { eq } from "drizzle-orm";
+import { eq, sql } from "drizzle-orm";
 import { db } from "@/lib/db/client";
 import {
   painPoints,
@@ -16,9 +16,42 @@ import {
   painPointTags,
 } from "@/lib/db/schema";
 import { successResponse, ApiErrors } from "@/lib/api/response";
+import { parseJsonField } from "@/lib/api/serializers";
 
 type Params = { params: Promise<{ id: string }> };
 
+type DimensionReasons = Record<string, { score: number; reason: string }>;
+
+// 预编译查询，模块加载时构建一次，每次请求只绑定 id 参数
+
+// 查询痛点及其关联数据
+const painPointDetailQuery = db
+  .select({
+    painPoint: painPoints,
+    post: posts,
+    subreddit: subreddits,
+    industry: industries,
+    painPointType: painPointTypes,
+  })
+  .from(painPoints)
+  .leftJoin(posts, eq(painPoints.postId, posts.id))
+  .leftJoin(subreddits, eq(posts.subredditId, subreddits.id))
+  .leftJoin(industries, eq(painPoints.industryCode, industries.code))
+  .leftJoin(painPointTypes, eq(painPoints.typeCode, painPointTypes.code))
+  .where(eq(painPoints.id, sql.placeholder("id")))
+  .limit(1)
+  .prepare();
+
+// 获取标签
+const painPointTagNamesQuery = db
+  .select({
+    tagName: tags.name,
+  })
+  .from(painPointTags)
+  .innerJoin(tags, eq(painPointTags.tagId, tags.id))
+  .where(eq(painPointTags.painPointId, sql.placeholder("id")))
+  .prepare();
+
 /**
  * GET /api/pain-points/[id]
  * 获取单个痛点的完整信息
@@ -27,22 +60,11 @@ export async function GET(request: NextRequest, { params }: Params) {
   try {
     const { id } = await params;
 
-    // 查询痛点及其关联数据
-    const results = await db
-      .select({
-        painPoint: painPoints,
-        post: posts,
-        subreddit: subreddits,
-        industry: industries,
-        painPointType: painPointTypes,
-      })
-      .from(painPoints)
-      .leftJoin(posts, eq(painPoints.postId, posts.id))
-      .leftJoin(subreddits, eq(posts.subredditId, subreddits.id))
-      .leftJoin(industries, eq(painPoints.industryCode, industries.code))
-      .leftJoin(painPointTypes, eq(painPoints.typeCode, painPointTypes.code))
-      .where(eq(painPoints.id, id))
-      .limit(1);
+    // 痛点与标签按同一 ID 查询，互不依赖，并发执行
+    const [results, tagsResult] = await Promise.all([
+      painPointDetailQuery.all({ id }),
+      painPointTagNamesQuery.all({ id }),
+    ]);
 
     if (results.length === 0) {
       return ApiErrors.notFound("痛点");
@@ -50,37 +72,10 @@ export async function GET(request: NextRequest, { params }: Params) {
 
     const { painPoint, post, subreddit, industry, painPointType } = results[0];
 
-    // 获取标签
-    const tagsResult = await db
-      .select({
-        tagName: tags.name,
-      })
-      .from(painPointTags)
-      .innerJoin(tags, eq(painPointTags.tagId, tags.id))
-      .where(eq(painPointTags.painPointId, id));
-
     const tagNames = tagsResult.map((t) => t.tagName);
 
-    // 解析 JSON 字段
-    const parseJsonField = (field: string | null): string[] | null => {
-      if (!field) return null;
-      try {
-        return JSON.parse(field);
-      } catch {
-        return null;
-      }
-    };
-
-    const parseDimensionReasons = (
-      field: string | null
-    ): Record<string, { score: number; reason: string }> | null => {
-      if (!field) return null;
-      try {
-        return JSON.parse(field);
-      } catch {
-        return null;
-      }
-    };
+    // 维度理由只解析一次，供各维度共用
+    const dimensionReasons = parseJsonField<DimensionReasons>(painPoint.dimensionReasons);
 
     // 构建响应数据
     const data = {
@@ -111,23 +106,23 @@ export async function GET(request: NextRequest, { params }: Params) {
       dimension_scores: {
         urgency: {
           score: painPoint.scoreUrgency,
-          reason: parseDimensionReasons(painPoint.dimensionReasons)?.urgency?.reason || "",
+          reason: dimensionReasons?.urgency?.reason || "",
         },
         frequency: {
           score: painPoint.scoreFrequency,
-          reason: parseDimensionReasons(painPoint.dimensionReasons)?.frequency?.reason || "",
+          reason: dimensionReasons?.frequency?.reason || "",
         },
         market_size: {
           score: painPoint.scoreMarketSize,
-          reason: parseDimensionReasons(painPoint.dimensionReasons)?.market_size?.reason || "",
+          reason: dimensionReasons?.market_size?.reason || "",
         },
         monetization: {
           score: painPoint.scoreMonetization,
-          reason: parseDimensionReasons(painPoint.dimensionReasons)?.monetization?.reason || "",
+          reason: dimensionReasons?.monetization?.reason || "",
         },
         barrier_to_entry: {
           score: painPoint.scoreBarrierToEntry,
-          reason: parseDimensionReasons(painPoint.dimensionReasons)?.barrier_to_entry?.reason || "",
+          reason: dimensionReasons?.barrier_to_entry?.reason || "",
         },
       },
       tags: tagNames,
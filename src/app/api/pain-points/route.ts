@@ -4,7 +4,8 @@
  */
 
 import { NextRequest } from "next/server";
-import { eq, desc, asc, sql, like, and, gte, lte, or } from "drizzle-orm";
+import { eq, desc, asc, sql, like, and, gte, lte, or, type SQL } from "drizzle-orm";
+import type { AnySQLiteColumn } from "drizzle-orm/sqlite-core";
 import { db } from "@/lib/db/client";
 import {
   painPoints,
@@ -16,6 +17,45 @@ import {
   painPointTags,
 } from "@/lib/db/schema";
 import { successResponse, ApiErrors } from "@/lib/api/response";
+import { parseJsonField } from "@/lib/api/serializers";
+
+// 新格式排序字段：sort + order 分开传递
+const SORT_COLUMNS = new Map<string, AnySQLiteColumn>([
+  ["total_score", painPoints.totalScore],
+  ["confidence", painPoints.confidence],
+  ["created_at", painPoints.createdAt],
+]);
+
+// 兼容旧格式：score_desc 等组合格式
+const LEGACY_SORT_ORDERS = new Map<string, SQL>([
+  ["score_desc", desc(painPoints.totalScore)],
+  ["score_asc", asc(painPoints.totalScore)],
+  ["confidence_desc", desc(painPoints.confidence)],
+  ["confidence_asc", asc(painPoints.confidence)],
+  ["created_at_asc", asc(painPoints.createdAt)],
+  ["reddit_score_desc", desc(posts.score)],
+  ["comments_desc", desc(posts.numComments)],
+  ["created_at_desc", desc(painPoints.createdAt)],
+]);
+
+// 默认按创建时间倒序
+const DEFAULT_SORT_ORDER = desc(painPoints.createdAt);
+
+/**
+ * 提取各维度的评分理由
+ */
+function formatDimensionReasons(field: string | null) {
+  const parsed = parseJsonField<Record<string, { reason?: string }>>(field);
+  if (!parsed) return null;
+
+  return {
+    urgency: parsed.urgency?.reason || "",
+    frequency: parsed.frequency?.reason || "",
+    market_size: parsed.market_size?.reason || "",
+    monetization: parsed.monetization?.reason || "",
+    barrier_to_entry: parsed.barrier_to_entry?.reason || "",
+  };
+}
 
 /**
  * GET /api/pain-points
@@ -75,212 +115,141 @@ export async function GET(request: NextRequest) {
       conditions.push(lte(painPoints.totalScore, parseFloat(scoreMax)));
     }
 
+    if (subredditFilter) {
+      const subredditNames = subredditFilter.split(",");
+      conditions.push(
+        sql`${subreddits.name} IN (${sql.join(
+          subredditNames.map((n) => sql`${n}`),
+          sql`, `
+        )})`
+      );
+    }
+
+    const whereClause = conditions.length > 0 ? and(...conditions) : undefined;
+
     // 解析排序参数（支持新格式 sort + order 和旧格式 score_desc 等）
     const order = searchParams.get("order") || "desc";
 
-    // 确定排序方式
-    let orderBy;
-    // 新格式：sort + order 分开传递
-    if (sort === "total_score" || sort === "confidence" || sort === "created_at") {
-      const isAsc = order === "asc";
-      switch (sort) {
-        case "total_score":
-          orderBy = isAsc ? asc(painPoints.totalScore) : desc(painPoints.totalScore);
-          break;
-        case "confidence":
-          orderBy = isAsc ? asc(painPoints.confidence) : desc(painPoints.confidence);
-          break;
-        case "created_at":
-          orderBy = isAsc ? asc(painPoints.createdAt) : desc(painPoints.createdAt);
-          break;
-      }
-    } else {
-      // 兼容旧格式：score_desc 等组合格式
-      switch (sort) {
-        case "score_desc":
-          orderBy = desc(painPoints.totalScore);
-          break;
-        case "score_asc":
-          orderBy = asc(painPoints.totalScore);
-          break;
-        case "confidence_desc":
-          orderBy = desc(painPoints.confidence);
-          break;
-        case "confidence_asc":
-          orderBy = asc(painPoints.confidence);
-          break;
-        case "created_at_asc":
-          orderBy = asc(painPoints.createdAt);
-          break;
-        case "reddit_score_desc":
-          orderBy = desc(posts.score);
-          break;
-        case "comments_desc":
-          orderBy = desc(posts.numComments);
-          break;
-        case "created_at_desc":
-        default:
-          orderBy = desc(painPoints.createdAt);
-      }
+    // 确定排序方式：优先新格式（sort + order 分开传递），否则兼容旧格式
+    const sortColumn = SORT_COLUMNS.get(sort);
+    let orderBy = LEGACY_SORT_ORDERS.get(sort) ?? DEFAULT_SORT_ORDER;
+    if (sortColumn) {
+      orderBy = order === "asc" ? asc(sortColumn) : desc(sortColumn);
     }
 
-    // 构建基础查询
-    const baseQuery = db
+    // 构建基础查询并应用筛选条件
+    const filteredQuery = db
       .select({
         painPoint: painPoints,
-        post: posts,
+        // 列表不展示帖子正文，只取需要的列，避免传输较大的 content 字段
+        post: {
+          id: posts.id,
+          redditId: posts.redditId,
+          title: posts.title,
+          author: posts.author,
+          url: posts.url,
+          score: posts.score,
+          numComments: posts.numComments,
+          redditCreatedAt: posts.redditCreatedAt,
+        },
         subreddit: subreddits,
         industry: industries,
         painPointType: painPointTypes,
+        // 通过关联子查询将标签聚合为 JSON 数组，避免额外查询
+        tagNames: sql<string>`(
+          SELECT json_group_array(${tags.name})
+          FROM ${painPointTags}
+          INNER JOIN ${tags} ON ${painPointTags.tagId} = ${tags.id}
+          WHERE ${painPointTags.painPointId} = ${painPoints.id}
+        )`,
       })
       .from(painPoints)
       .leftJoin(posts, eq(painPoints.postId, posts.id))
       .leftJoin(subreddits, eq(posts.subredditId, subreddits.id))
       .leftJoin(industries, eq(painPoints.industryCode, industries.code))
-      .leftJoin(painPointTypes, eq(painPoints.typeCode, painPointTypes.code));
-
-    // 应用筛选条件
-    let filteredQuery = baseQuery;
-    if (conditions.length > 0) {
-      filteredQuery = baseQuery.where(and(...conditions)) as typeof baseQuery;
-    }
+      .leftJoin(painPointTypes, eq(painPoints.typeCode, painPointTypes.code))
+      .where(whereClause);
 
-    // 应用 subreddit 筛选
-    if (subredditFilter) {
-      const subredditNames = subredditFilter.split(",");
-      filteredQuery = filteredQuery.where(
-        sql`${subreddits.name} IN (${sql.join(
-          subredditNames.map((n) => sql`${n}`),
-          sql`, `
-        )})`
-      ) as typeof baseQuery;
-    }
+    // 计数只在按 subreddit 筛选时才需要关联帖子和 subreddit 表
+    const countSelection = { count: sql<number>`count(*)` };
+    const countQuery = subredditFilter
+      ? db
+          .select(countSelection)
+          .from(painPoints)
+          .leftJoin(posts, eq(painPoints.postId, posts.id))
+          .leftJoin(subreddits, eq(posts.subredditId, subreddits.id))
+          .where(whereClause)
+      : db.select(countSelection).from(painPoints).where(whereClause);
 
-    // 获取总数
-    const countResult = await db
-      .select({ count: sql<number>`count(*)` })
-      .from(painPoints)
-      .leftJoin(posts, eq(painPoints.postId, posts.id))
-      .leftJoin(subreddits, eq(posts.subredditId, subreddits.id))
-      .where(conditions.length > 0 ? and(...conditions) : undefined);
+    // 总数与分页数据互不依赖，并发查询
+    const [countResult, results] = await Promise.all([
+      countQuery,
+      filteredQuery.orderBy(orderBy).limit(perPage).offset(offset),
+    ]);
 
     const total = countResult[0]?.count ?? 0;
     const totalPages = Math.ceil(total / perPage);
 
-    // 获取分页数据
-    const results = await filteredQuery.orderBy(orderBy).limit(perPage).offset(offset);
-
-    // 获取每个痛点的标签
-    const painPointIds = results.map((r) => r.painPoint.id);
-    const tagsMap: Record<string, string[]> = {};
-
-    if (painPointIds.length > 0) {
-      const tagsResult = await db
-        .select({
-          painPointId: painPointTags.painPointId,
-          tagName: tags.name,
-        })
-        .from(painPointTags)
-        .innerJoin(tags, eq(painPointTags.tagId, tags.id))
-        .where(
-          sql`${painPointTags.painPointId} IN (${sql.join(
-            painPointIds.map((id) => sql`${id}`),
-            sql`, `
-          )})`
-        );
-
-      for (const row of tagsResult) {
-        if (!tagsMap[row.painPointId]) {
-          tagsMap[row.painPointId] = [];
-        }
-        tagsMap[row.painPointId].push(row.tagName);
-      }
-    }
-
-    // 辅助函数：解析 JSON 字段
-    const parseJsonField = (field: string | null): string[] | null => {
-      if (!field) return null;
-      try {
-        return JSON.parse(field);
-      } catch {
-        return null;
-      }
-    };
-
     // 格式化响应数据
-    const data = results.map(({ painPoint, post, subreddit, industry, painPointType }) => ({
-      id: painPoint.id,
-      title: painPoint.title,
-      description: painPoint.description,
-      user_need: painPoint.userNeed,
-      current_solution: painPoint.currentSolution,
-      ideal_solution: painPoint.idealSolution,
-      mentioned_competitors: parseJsonField(painPoint.mentionedCompetitors),
-      quotes: parseJsonField(painPoint.quotes),
-      target_personas: parseJsonField(painPoint.targetPersonas),
-      actionable_insights: parseJsonField(painPoint.actionableInsights),
-      industry_code: painPoint.industryCode,
-      type_code: painPoint.typeCode,
-      industry: industry
-        ? {
-            code: industry.code,
-            name: industry.name,
-          }
-        : null,
-      type: painPointType
-        ? {
-            code: painPointType.code,
-            name: painPointType.name,
-          }
-        : null,
-      total_score: painPoint.totalScore,
-      confidence: painPoint.confidence,
-      dimension_scores: {
-        urgency: painPoint.scoreUrgency,
-        frequency: painPoint.scoreFrequency,
-        market_size: painPoint.scoreMarketSize,
-        monetization: painPoint.scoreMonetization,
-        barrier_to_entry: painPoint.scoreBarrierToEntry,
-      },
-      dimension_reasons: painPoint.dimensionReasons
-        ? (() => {
-            try {
-              const parsed = JSON.parse(painPoint.dimensionReasons);
-              return {
-                urgency: parsed.urgency?.reason || "",
-                frequency: parsed.frequency?.reason || "",
-                market_size: parsed.market_size?.reason || "",
-                monetization: parsed.monetization?.reason || "",
-                barrier_to_entry: parsed.barrier_to_entry?.reason || "",
-              };
-            } catch {
-              return null;
+    const data = results.map(
+      ({ painPoint, post, subreddit, industry, painPointType, tagNames }) => ({
+        id: painPoint.id,
+        title: painPoint.title,
+        description: painPoint.description,
+        user_need: painPoint.userNeed,
+        current_solution: painPoint.currentSolution,
+        ideal_solution: painPoint.idealSolution,
+        mentioned_competitors: parseJsonField(painPoint.mentionedCompetitors),
+        quotes: parseJsonField(painPoint.quotes),
+        target_personas: parseJsonField(painPoint.targetPersonas),
+        actionable_insights: parseJsonField(painPoint.actionableInsights),
+        industry_code: painPoint.industryCode,
+        type_code: painPoint.typeCode,
+        industry: industry
+          ? {
+              code: industry.code,
+              name: industry.name,
+            }
+          : null,
+        type: painPointType
+          ? {
+              code: painPointType.code,
+              name: painPointType.name,
             }
-          })()
-        : null,
-      tags: tagsMap[painPoint.id] || [],
-      post: post
-        ? {
-            id: post.id,
-            subreddit: subreddit
-              ? {
-                  id: subreddit.id,
-                  name: subreddit.name,
-                }
-              : null,
-            reddit_id: post.redditId,
-            title: post.title,
-            content: post.content,
-            author: post.author,
-            url: post.url,
-            score: post.score,
-            num_comments: post.numComments,
-            reddit_created_at: post.redditCreatedAt,
-          }
-        : null,
-      created_at: painPoint.createdAt,
-      updated_at: painPoint.updatedAt,
-    }));
+          : null,
+        total_score: painPoint.totalScore,
+        confidence: painPoint.confidence,
+        dimension_scores: {
+          urgency: painPoint.scoreUrgency,
+          frequency: painPoint.scoreFrequency,
+          market_size: painPoint.scoreMarketSize,
+          monetization: painPoint.scoreMonetization,
+          barrier_to_entry: painPoint.scoreBarrierToEntry,
+        },
+        dimension_reasons: formatDimensionReasons(painPoint.dimensionReasons),
+        tags: parseJsonField(tagNames) ?? [],
+        post: post
+          ? {
+              id: post.id,
+              subreddit: subreddit
+                ? {
+                    id: subreddit.id,
+                    name: subreddit.name,
+                  }
+                : null,
+              reddit_id: post.redditId,
+              title: post.title,
+              author: post.author,
+              url: post.url,
+              score: post.score,
+              num_comments: post.numComments,
+              reddit_created_at: post.redditCreatedAt,
+            }
+          : null,
+        created_at: painPoint.createdAt,
+        updated_at: painPoint.updatedAt,
+      })
+    );
 
     return successResponse(data, {
       page,
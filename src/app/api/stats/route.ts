@@ -8,6 +8,15 @@ import { sql } from "drizzle-orm";
 import { db } from "@/lib/db/client";
 import { painPoints, posts, subreddits } from "@/lib/db/schema";
 import { successResponse, ApiErrors } from "@/lib/api/response";
+import { cached, STATS_CACHE_PREFIX } from "@/lib/cache";
+
+// 统计数据缓存时间（30 秒）
+// 缓存仅存在于当前进程：Subreddit 写操作只清除本实例的缓存，
+// 外部抓取/分析流程写入帖子和痛点后不会触发失效，最多延迟一个 TTL 才反映到统计中
+const STATS_CACHE_TTL = 30 * 1000;
+
+// 时区偏移量的最大绝对值（分钟），对应 UTC±14
+const MAX_TIMEZONE_OFFSET = 14 * 60;
 
 /**
  * GET /api/stats
@@ -16,7 +25,18 @@ import { successResponse, ApiErrors } from "@/lib/api/response";
 export async function GET(request: NextRequest) {
   try {
     // 从请求头获取时区偏移量（分钟），默认使用 UTC+8（-480 分钟）
-    const timezoneOffset = parseInt(request.headers.get("x-timezone-offset") || "-480", 10);
+    const timezoneOffset = Number(request.headers.get("x-timezone-offset") || "-480");
+
+    // 时区偏移必须是合法范围内的整数分钟，否则日期计算会出错
+    if (
+      !Number.isInteger(timezoneOffset) ||
+      timezoneOffset < -MAX_TIMEZONE_OFFSET ||
+      timezoneOffset > MAX_TIMEZONE_OFFSET
+    ) {
+      return ApiErrors.validationError("无效的时区偏移", [
+        { field: "x-timezone-offset", message: "必须是 -840 到 840 之间的整数（分钟）" },
+      ]);
+    }
 
     // 计算用户本地时间的今天起始时间（UTC 表示）
     // timezoneOffset 是浏览器返回的值，例如 UTC+8 返回 -480
@@ -33,54 +53,50 @@ export async function GET(request: NextRequest) {
     }
 
     // 格式化为 SQLite 兼容格式：YYYY-MM-DD HH:MM:SS
-    const todayStr = localMidnight
-      .toISOString()
-      .replace("T", " ")
-      .replace(/\.\d{3}Z$/, "");
-
-    // 查询今日新增痛点数（基于用户本地时区的今天）
-    const newTodayResult = await db
-      .select({ count: sql<number>`count(*)` })
-      .from(painPoints)
-      .where(sql`${painPoints.createdAt} >= ${todayStr}`);
-
-    const newToday = newTodayResult[0]?.count ?? 0;
-
-    // 查询痛点总数
-    const totalResult = await db.select({ count: sql<number>`count(*)` }).from(painPoints);
-
-    const totalPainPoints = totalResult[0]?.count ?? 0;
-
-    // 查询活跃 Subreddit 数量
-    const activeSubredditsResult = await db
-      .select({ count: sql<number>`count(*)` })
-      .from(subreddits)
-      .where(sql`${subreddits.isActive} = 1`);
-
-    const activeSubreddits = activeSubredditsResult[0]?.count ?? 0;
-
-    // 查询待处理帖子数
-    const pendingPostsResult = await db
-      .select({ count: sql<number>`count(*)` })
-      .from(posts)
-      .where(sql`${posts.processStatus} = 'pending'`);
-
-    const pendingPosts = pendingPostsResult[0]?.count ?? 0;
-
-    // 查询平均评分
-    const avgScoreResult = await db
-      .select({ avg: sql<number>`avg(${painPoints.totalScore})` })
-      .from(painPoints);
-
-    const avgScore = avgScoreResult[0]?.avg ?? 0;
-
-    return successResponse({
-      new_today: newToday,
-      total_pain_points: totalPainPoints,
-      active_subreddits: activeSubreddits,
-      pending_posts: pendingPosts,
-      avg_score: Math.round(avgScore * 100) / 100,
+    // toISOString 输出固定为 YYYY-MM-DDTHH:MM:SS.sssZ，直接截取前 19 位即可
+    const todayStr = localMidnight.toISOString().slice(0, 19).replace("T", " ");
+
+    // 统计数据允许短暂延迟，按"今天"起始时间缓存，避免频繁刷新时重复查询
+    const data = await cached(`${STATS_CACHE_PREFIX}${todayStr}`, STATS_CACHE_TTL, async () => {
+      // 各统计项合并为一条带标量子查询的 SELECT，一次往返取回全部结果
+      const [row] = await db.all<{
+        newToday: number | null;
+        totalPainPoints: number | null;
+        activeSubreddits: number | null;
+        pendingPosts: number | null;
+        avgScore: number | null;
+      }>(sql`
+        SELECT
+          -- 今日新增痛点数（基于用户本地时区的今天）
+          (
+            SELECT count(*) FROM ${painPoints} WHERE ${painPoints.createdAt} >= ${todayStr}
+          ) AS newToday,
+          -- 痛点总数
+          (SELECT count(*) FROM ${painPoints}) AS totalPainPoints,
+          -- 活跃 Subreddit 数量
+          (SELECT count(*) FROM ${subreddits} WHERE ${subreddits.isActive} = 1) AS activeSubreddits,
+          -- 待处理帖子数
+          (SELECT count(*) FROM ${posts} WHERE ${posts.processStatus} = 'pending') AS pendingPosts,
+          -- 平均评分
+          (SELECT avg(${painPoints.totalScore}) FROM ${painPoints}) AS avgScore
+      `);
+
+      const newToday = row?.newToday ?? 0;
+      const totalPainPoints = row?.totalPainPoints ?? 0;
+      const activeSubreddits = row?.activeSubreddits ?? 0;
+      const pendingPosts = row?.pendingPosts ?? 0;
+      const avgScore = row?.avgScore ?? 0;
+
+      return {
+        new_today: newToday,
+        total_pain_points: totalPainPoints,
+        active_subreddits: activeSubreddits,
+        pending_posts: pendingPosts,
+        avg_score: Math.round(avgScore * 100) / 100,
+      };
     });
+
+    return successResponse(data);
   } catch (error) {
     console.error("获取统计信息失败:", error);
     return ApiErrors.databaseError("获取统计信息失败");
@@ -10,6 +10,9 @@ import { eq, inArray } from "drizzle-orm";
 import { db } from "@/lib/db/client";
 import { subreddits, posts, painPoints, painPointTags } from "@/lib/db/schema";
 import { successResponse, ApiErrors } from "@/lib/api/response";
+import { toSubredditResponse } from "@/lib/api/serializers";
+import { isValidFetchFrequency, invalidFetchFrequencyError } from "@/lib/api/validation";
+import { invalidateCache, STATS_CACHE_PREFIX } from "@/lib/cache";
 
 type Params = { params: Promise<{ id: string }> };
 
@@ -29,18 +32,7 @@ export async function GET(request: NextRequest, { params }: Params) {
 
     const sub = result[0];
 
-    return successResponse({
-      id: sub.id,
-      name: sub.name,
-      display_name: sub.displayName,
-      description: sub.description,
-      is_active: sub.isActive,
-      fetch_frequency: sub.fetchFrequency,
-      posts_limit: sub.postsLimit,
-      last_fetched_at: sub.lastFetchedAt,
-      created_at: sub.createdAt,
-      updated_at: sub.updatedAt,
-    });
+    return successResponse(toSubredditResponse(sub));
   } catch (error) {
     console.error("获取 Subreddit 详情失败:", error);
     return ApiErrors.databaseError("获取 Subreddit 详情失败");
@@ -56,13 +48,6 @@ export async function PATCH(request: NextRequest, { params }: Params) {
     const { id } = await params;
     const body = await request.json();
 
-    // 检查是否存在
-    const existing = await db.select().from(subreddits).where(eq(subreddits.id, id)).limit(1);
-
-    if (existing.length === 0) {
-      return ApiErrors.notFound("Subreddit");
-    }
-
     // 构建更新数据
     const updateData: Record<string, unknown> = {
       updatedAt: new Date().toISOString(),
@@ -79,11 +64,8 @@ export async function PATCH(request: NextRequest, { params }: Params) {
     }
     if (body.fetch_frequency !== undefined) {
       // 验证频率值
-      const validFrequencies = ["hourly", "daily", "weekly"];
-      if (!validFrequencies.includes(body.fetch_frequency)) {
-        return ApiErrors.validationError("无效的抓取频率", [
-          { field: "fetch_frequency", message: "必须是 hourly, daily 或 weekly" },
-        ]);
+      if (!isValidFetchFrequency(body.fetch_frequency)) {
+        return invalidFetchFrequencyError();
       }
       updateData.fetchFrequency = body.fetch_frequency;
     }
@@ -97,26 +79,23 @@ export async function PATCH(request: NextRequest, { params }: Params) {
       updateData.postsLimit = limit;
     }
 
-    // 执行更新
-    await db.update(subreddits).set(updateData).where(eq(subreddits.id, id));
+    // 执行更新并直接返回更新后的数据，未命中说明记录不存在
+    const updated = await db
+      .update(subreddits)
+      .set(updateData)
+      .where(eq(subreddits.id, id))
+      .returning();
 
-    // 获取更新后的数据
-    const updated = await db.select().from(subreddits).where(eq(subreddits.id, id)).limit(1);
+    if (updated.length === 0) {
+      return ApiErrors.notFound("Subreddit");
+    }
+
+    // 活跃状态可能变化，清除统计缓存
+    invalidateCache(STATS_CACHE_PREFIX);
 
     const sub = updated[0];
 
-    return successResponse({
-      id: sub.id,
-      name: sub.name,
-      display_name: sub.displayName,
-      description: sub.description,
-      is_active: sub.isActive,
-      fetch_frequency: sub.fetchFrequency,
-      posts_limit: sub.postsLimit,
-      last_fetched_at: sub.lastFetchedAt,
-      created_at: sub.createdAt,
-      updated_at: sub.updatedAt,
-    });
+    return successResponse(toSubredditResponse(sub));
   } catch (error) {
     console.error("更新 Subreddit 失败:", error);
     return ApiErrors.databaseError("更新 Subreddit 失败");
@@ -132,44 +111,34 @@ export async function DELETE(request: NextRequest, { params }: Params) {
   try {
     const { id } = await params;
 
-    // 检查是否存在
-    const existing = await db.select().from(subreddits).where(eq(subreddits.id, id)).limit(1);
-
-    if (existing.length === 0) {
-      return ApiErrors.notFound("Subreddit");
-    }
-
-    // 获取该 subreddit 下的所有 posts
-    const relatedPosts = await db
+    // 以子查询定位关联数据，无需先把 ID 拉回应用层
+    const relatedPostIds = db
       .select({ id: posts.id })
       .from(posts)
       .where(eq(posts.subredditId, id));
-
-    if (relatedPosts.length > 0) {
-      const postIds = relatedPosts.map((p) => p.id);
-
-      // 获取这些 posts 关联的所有 painPoints
-      const relatedPainPoints = await db
-        .select({ id: painPoints.id })
-        .from(painPoints)
-        .where(inArray(painPoints.postId, postIds));
-
-      if (relatedPainPoints.length > 0) {
-        const painPointIds = relatedPainPoints.map((pp) => pp.id);
-
-        // 1. 删除 painPointTags（痛点标签关联）
-        await db.delete(painPointTags).where(inArray(painPointTags.painPointId, painPointIds));
-
-        // 2. 删除 painPoints（痛点）
-        await db.delete(painPoints).where(inArray(painPoints.id, painPointIds));
-      }
-
+    const relatedPainPointIds = db
+      .select({ id: painPoints.id })
+      .from(painPoints)
+      .where(inArray(painPoints.postId, relatedPostIds));
+
+    // 在同一事务中批量执行级联删除，一次往返且保证原子性
+    const [, , , deleted] = await db.batch([
+      // 1. 删除 painPointTags（痛点标签关联）
+      db.delete(painPointTags).where(inArray(painPointTags.painPointId, relatedPainPointIds)),
+      // 2. 删除 painPoints（痛点）
+      db.delete(painPoints).where(inArray(painPoints.postId, relatedPostIds)),
       // 3. 删除 posts（帖子）
-      await db.delete(posts).where(inArray(posts.id, postIds));
+      db.delete(posts).where(eq(posts.subredditId, id)),
+      // 4. 删除 subreddit，未删除任何记录说明不存在
+      db.delete(subreddits).where(eq(subreddits.id, id)).returning({ id: subreddits.id }),
+    ]);
+
+    if (deleted.length === 0) {
+      return ApiErrors.notFound("Subreddit");
     }
 
-    // 4. 删除 subreddit
-    await db.delete(subreddits).where(eq(subreddits.id, id));
+    // 级联删除影响所有统计项，清除统计缓存
+    invalidateCache(STATS_CACHE_PREFIX);
 
     // 返回 204 No Content
     return new Response(null, { status: 204 });
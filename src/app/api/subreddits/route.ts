@@ -10,6 +10,12 @@ import { v4 as uuidv4 } from "uuid";
 import { db } from "@/lib/db/client";
 import { subreddits, posts, painPoints } from "@/lib/db/schema";
 import { successResponse, ApiErrors } from "@/lib/api/response";
+import { toSubredditResponse } from "@/lib/api/serializers";
+import { isValidFetchFrequency, invalidFetchFrequencyError } from "@/lib/api/validation";
+import { invalidateCache, STATS_CACHE_PREFIX } from "@/lib/cache";
+
+// Subreddit 名称格式（只允许字母、数字、下划线）
+const SUBREDDIT_NAME_REGEX = /^[a-zA-Z0-9_]+$/;
 
 /**
  * GET /api/subreddits
@@ -29,42 +35,32 @@ export async function GET(request: NextRequest) {
       query = query.where(eq(subreddits.isActive, isActive)) as typeof query;
     }
 
-    const result = await query.orderBy(subreddits.name);
-
-    // 获取每个 Subreddit 的统计数据
-    const dataWithStats = await Promise.all(
-      result.map(async (sub) => {
-        // 统计帖子数量
-        const postsCount = await db
-          .select({ count: count() })
-          .from(posts)
-          .where(eq(posts.subredditId, sub.id));
-
-        // 统计痛点数量（通过关联帖子）
-        const painPointsCount = await db
-          .select({ count: count() })
-          .from(painPoints)
-          .innerJoin(posts, eq(painPoints.postId, posts.id))
-          .where(eq(posts.subredditId, sub.id));
-
-        return {
-          id: sub.id,
-          name: sub.name,
-          display_name: sub.displayName,
-          description: sub.description,
-          is_active: sub.isActive,
-          fetch_frequency: sub.fetchFrequency,
-          posts_limit: sub.postsLimit,
-          last_fetched_at: sub.lastFetchedAt,
-          created_at: sub.createdAt,
-          updated_at: sub.updatedAt,
-          stats: {
-            total_posts: postsCount[0]?.count ?? 0,
-            total_pain_points: painPointsCount[0]?.count ?? 0,
-          },
-        };
-      })
-    );
+    // 列表与分组统计互不依赖，三个查询并发执行
+    // 按 Subreddit 分组统计帖子与痛点数量，避免逐个 Subreddit 查询
+    const [result, postsCounts, painPointsCounts] = await Promise.all([
+      query.orderBy(subreddits.name),
+      db
+        .select({ subredditId: posts.subredditId, count: count() })
+        .from(posts)
+        .groupBy(posts.subredditId),
+      // 痛点数量通过关联帖子统计
+      db
+        .select({ subredditId: posts.subredditId, count: count() })
+        .from(painPoints)
+        .innerJoin(posts, eq(painPoints.postId, posts.id))
+        .groupBy(posts.subredditId),
+    ]);
+
+    const postsCountMap = new Map(postsCounts.map((row) => [row.subredditId, row.count]));
+    const painPointsCountMap = new Map(painPointsCounts.map((row) => [row.subredditId, row.count]));
+
+    const dataWithStats = result.map((sub) => ({
+      ...toSubredditResponse(sub),
+      stats: {
+        total_posts: postsCountMap.get(sub.id) ?? 0,
+        total_pain_points: painPointsCountMap.get(sub.id) ?? 0,
+      },
+    }));
 
     return successResponse(dataWithStats);
   } catch (error) {
@@ -88,21 +84,14 @@ export async function POST(request: NextRequest) {
       ]);
     }
 
-    // 验证名称格式（只允许字母、数字、下划线）
-    const nameRegex = /^[a-zA-Z0-9_]+$/;
-    if (!nameRegex.test(body.name)) {
+    // 验证名称格式
+    if (!SUBREDDIT_NAME_REGEX.test(body.name)) {
       return ApiErrors.invalidSubredditName();
     }
 
-    // 检查是否已存在
-    const existing = await db
-      .select()
-      .from(subreddits)
-      .where(eq(subreddits.name, body.name.toLowerCase()))
-      .limit(1);
-
-    if (existing.length > 0) {
-      return ApiErrors.subredditExists();
+    // 验证频率值
+    if (body.fetch_frequency !== undefined && !isValidFetchFrequency(body.fetch_frequency)) {
+      return invalidFetchFrequencyError();
     }
 
     // 创建新记录
@@ -120,23 +109,21 @@ export async function POST(request: NextRequest) {
       updatedAt: now,
     };
 
-    await db.insert(subreddits).values(newSubreddit);
-
-    return successResponse(
-      {
-        id: newSubreddit.id,
-        name: newSubreddit.name,
-        display_name: newSubreddit.displayName,
-        description: newSubreddit.description,
-        is_active: newSubreddit.isActive,
-        fetch_frequency: newSubreddit.fetchFrequency,
-        posts_limit: newSubreddit.postsLimit,
-        last_fetched_at: newSubreddit.lastFetchedAt,
-        created_at: newSubreddit.createdAt,
-        updated_at: newSubreddit.updatedAt,
-      },
-      undefined
-    );
+    // 名称冲突时不插入，借助唯一约束在一次往返内完成存在性检查
+    const inserted = await db
+      .insert(subreddits)
+      .values(newSubreddit)
+      .onConflictDoNothing({ target: subreddits.name })
+      .returning();
+
+    if (inserted.length === 0) {
+      return ApiErrors.subredditExists();
+    }
+
+    // 活跃 Subreddit 数量可能变化，清除统计缓存
+    invalidateCache(STATS_CACHE_PREFIX);
+
+    return successResponse(toSubredditResponse(inserted[0]), undefined);
   } catch (error) {
     console.error("创建 Subreddit 失败:", error);
     return ApiErrors.databaseError("创建 Subreddit 失败");
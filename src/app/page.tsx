@@ -66,12 +66,14 @@ export default function HomePage() {
   };
 
   // 计算统计数据
-  const topIndustries = painPoints.reduce((acc, pp) => {
-    if (pp.industry_code && !acc.includes(pp.industry_code as IndustryCode)) {
-      acc.push(pp.industry_code as IndustryCode);
+  // 使用 Set 去重（保持首次出现顺序），避免在循环中线性查找
+  const industryCodeSet = new Set<IndustryCode>();
+  for (const pp of painPoints) {
+    if (pp.industry_code) {
+      industryCodeSet.add(pp.industry_code as IndustryCode);
     }
-    return acc;
-  }, [] as IndustryCode[]);
+  }
+  const topIndustries = Array.from(industryCodeSet);
 
   const avgScore =
     painPoints.length > 0
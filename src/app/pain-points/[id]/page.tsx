@@ -17,17 +17,7 @@ import { ArrowLeft, AlertTriangle, ExternalLink, Copy, Share2 } from "lucide-rea
 import { formatDistanceToNow } from "date-fns";
 import { zhCN } from "date-fns/locale";
 import { toast } from "sonner";
-
-/**
- * 将时间字符串标准化为 UTC（如果没有时区信息）
- */
-function normalizeToUTC(dateString: string): Date {
-  let normalized = dateString;
-  if (!dateString.endsWith("Z") && !dateString.match(/[+-]\d{2}:\d{2}$/)) {
-    normalized = dateString + "Z";
-  }
-  return new Date(normalized);
-}
+import { normalizeToUTC } from "@/lib/utils";
 
 export default function PainPointDetailPage() {
   const params = useParams();
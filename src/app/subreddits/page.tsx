@@ -36,6 +36,7 @@ import { Subreddit } from "@/types";
 import { toast } from "sonner";
 import { formatDistanceToNow } from "date-fns";
 import { zhCN } from "date-fns/locale";
+import { normalizeToUTC } from "@/lib/utils";
 import {
   Plus,
   MoreHorizontal,
@@ -48,17 +49,6 @@ import {
   FileText,
 } from "lucide-react";
 
-/**
- * 将时间字符串标准化为 UTC（如果没有时区信息）
- */
-function normalizeToUTC(dateString: string): Date {
-  let normalized = dateString;
-  if (!dateString.endsWith("Z") && !dateString.match(/[+-]\d{2}:\d{2}$/)) {
-    normalized = dateString + "Z";
-  }
-  return new Date(normalized);
-}
-
 const FETCH_FREQUENCY_LABELS: Record<string, string> = {
   hourly: "每小时",
   daily: "每天",
@@ -35,6 +35,10 @@ const sortOptions: { value: SortOption; label: string }[] = [
   { value: "created_at", label: "发布时间" },
 ];
 
+// 行业与痛点类型选项为静态数据，模块加载时生成一次，避免每次渲染重复构建
+const industryOptions = Object.entries(INDUSTRY_NAMES);
+const typeOptions = Object.entries(PAIN_POINT_TYPE_NAMES);
+
 /**
  * 筛选工具栏组件
  */
@@ -152,7 +156,7 @@ export function FilterBar({ filters, onFiltersChange, onClear }: FilterBarProps)
           </SelectTrigger>
           <SelectContent>
             <SelectItem value="all">全部行业</SelectItem>
-            {Object.entries(INDUSTRY_NAMES).map(([code, name]) => (
+            {industryOptions.map(([code, name]) => (
               <SelectItem key={code} value={code}>
                 {name}
               </SelectItem>
@@ -186,7 +190,7 @@ export function FilterBar({ filters, onFiltersChange, onClear }: FilterBarProps)
                   </SelectTrigger>
                   <SelectContent>
                     <SelectItem value="all">全部类型</SelectItem>
-                    {Object.entries(PAIN_POINT_TYPE_NAMES).map(([code, name]) => (
+                    {typeOptions.map(([code, name]) => (
                       <SelectItem key={code} value={code}>
                         {name}
                       </SelectItem>
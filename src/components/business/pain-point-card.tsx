@@ -15,7 +15,7 @@ import {
   DollarSign,
   Shield,
 } from "lucide-react";
-import { cn } from "@/lib/utils";
+import { cn, normalizeToUTC } from "@/lib/utils";
 import { Tooltip, TooltipContent, TooltipProvider, TooltipTrigger } from "@/components/ui/tooltip";
 
 interface PainPointCardProps {
@@ -89,12 +89,7 @@ export function PainPointCard({
     if (!dateString) return "";
 
     // 如果时间字符串没有时区信息，假设它是 UTC 时间
-    let normalizedDateString = dateString;
-    if (!dateString.endsWith("Z") && !dateString.match(/[+-]\d{2}:\d{2}$/)) {
-      normalizedDateString = dateString + "Z";
-    }
-
-    const date = new Date(normalizedDateString);
+    const date = normalizeToUTC(dateString);
     const now = new Date();
     const diffMs = now.getTime() - date.getTime();
     const diffHours = Math.floor(diffMs / (1000 * 60 * 60));
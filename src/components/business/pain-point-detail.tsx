@@ -1,6 +1,6 @@
 "use client";
 
-import { useState } from "react";
+import { useMemo, useState } from "react";
 import { PainPoint, DimensionScores, IndustryCode, PainPointTypeCode, Quote } from "@/types";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Separator } from "@/components/ui/separator";
@@ -79,42 +79,49 @@ export function PainPointDetail({
   // 用户原声语言切换状态
   const [quoteLang, setQuoteLang] = useState<"zh" | "en">("zh");
 
-  // 处理维度评分格式
-  const rawScores: RawDimensionScores =
-    (painPoint.dimension_scores as unknown as RawDimensionScores) || {};
-
-  const dimensionScores: DimensionScores = {
-    urgency: extractScore(rawScores.urgency),
-    frequency: extractScore(rawScores.frequency),
-    market_size: extractScore(rawScores.market_size),
-    monetization: extractScore(rawScores.monetization),
-    barrier_to_entry: extractScore(rawScores.barrier_to_entry),
-  };
-
-  // 提取维度理由 - 支持多种数据格式
-  const extractReason = (key: string): string => {
-    // 1. 首先尝试从 dimension_reasons 字段获取（列表 API 返回的格式）
+  // 维度评分与理由只依赖 painPoint，缓存结果以免其他状态变化（如切换原声语言）时重复解析
+  const { dimensionScores, dimensionReasons } = useMemo(() => {
+    // 处理维度评分格式
+    const rawScores: RawDimensionScores =
+      (painPoint.dimension_scores as unknown as RawDimensionScores) || {};
+
+    const dimensionScores: DimensionScores = {
+      urgency: extractScore(rawScores.urgency),
+      frequency: extractScore(rawScores.frequency),
+      market_size: extractScore(rawScores.market_size),
+      monetization: extractScore(rawScores.monetization),
+      barrier_to_entry: extractScore(rawScores.barrier_to_entry),
+    };
+
+    // 列表 API 返回的 dimension_reasons 字段，对所有维度只需读取一次
     const directReason = (painPoint as unknown as Record<string, unknown>).dimension_reasons as
       | Record<string, string>
       | undefined;
-    if (directReason?.[key]) return directReason[key];
-
-    // 2. 尝试从 dimension_scores 中的对象格式获取（详情 API 返回的格式）
-    const scoreValue = rawScores[key];
-    if (scoreValue && typeof scoreValue === "object" && "reason" in scoreValue) {
-      return scoreValue.reason || "";
-    }
-
-    return "";
-  };
-
-  const dimensionReasons: Record<string, string> = {
-    urgency: extractReason("urgency"),
-    frequency: extractReason("frequency"),
-    market_size: extractReason("market_size"),
-    monetization: extractReason("monetization"),
-    barrier_to_entry: extractReason("barrier_to_entry"),
-  };
+
+    // 提取维度理由 - 支持多种数据格式
+    const extractReason = (key: string): string => {
+      // 1. 首先尝试从 dimension_reasons 字段获取（列表 API 返回的格式）
+      if (directReason?.[key]) return directReason[key];
+
+      // 2. 尝试从 dimension_scores 中的对象格式获取（详情 API 返回的格式）
+      const scoreValue = rawScores[key];
+      if (scoreValue && typeof scoreValue === "object" && "reason" in scoreValue) {
+        return scoreValue.reason || "";
+      }
+
+      return "";
+    };
+
+    const dimensionReasons: Record<string, string> = {
+      urgency: extractReason("urgency"),
+      frequency: extractReason("frequency"),
+      market_size: extractReason("market_size"),
+      monetization: extractReason("monetization"),
+      barrier_to_entry: extractReason("barrier_to_entry"),
+    };
+
+    return { dimensionScores, dimensionReasons };
+  }, [painPoint]);
 
   const isCompact = layout === "compact";
 
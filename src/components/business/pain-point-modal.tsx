@@ -10,6 +10,7 @@ import { ExternalLink, Copy, Share2, X } from "lucide-react";
 import { formatDistanceToNow } from "date-fns";
 import { zhCN } from "date-fns/locale";
 import { toast } from "sonner";
+import { normalizeToUTC } from "@/lib/utils";
 
 interface PainPointModalProps {
   painPoint: PainPoint | null;
@@ -17,17 +18,6 @@ interface PainPointModalProps {
   onOpenChange: (open: boolean) => void;
 }
 
-/**
- * 将时间字符串标准化为 UTC（如果没有时区信息）
- */
-function normalizeToUTC(dateString: string): Date {
-  let normalized = dateString;
-  if (!dateString.endsWith("Z") && !dateString.match(/[+-]\d{2}:\d{2}$/)) {
-    normalized = dateString + "Z";
-  }
-  return new Date(normalized);
-}
-
 /**
  * 痛点详情弹窗组件
  */
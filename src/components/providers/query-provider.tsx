@@ -2,6 +2,10 @@
 
 import { QueryClient, QueryClientProvider } from "@tanstack/react-query";
 import { useState } from "react";
+import { ApiError } from "@/lib/api/client";
+
+// 可以退避后重试的 4xx 状态码：408 请求超时、429 请求过多
+const RETRYABLE_CLIENT_STATUSES = new Set([408, 429]);
 
 export function QueryProvider({ children }: { children: React.ReactNode }) {
   const [queryClient] = useState(
@@ -11,6 +15,19 @@ export function QueryProvider({ children }: { children: React.ReactNode }) {
           queries: {
             staleTime: 60 * 1000, // 1 minute
             refetchOnWindowFocus: false,
+            // 4xx 属于请求本身的问题，重试也不会成功（408 超时、429 限流除外）；
+            // 其他错误最多重试 3 次（指数退避）
+            retry: (failureCount, error) => {
+              if (
+                error instanceof ApiError &&
+                error.status >= 400 &&
+                error.status < 500 &&
+                !RETRYABLE_CLIENT_STATUSES.has(error.status)
+              ) {
+                return false;
+              }
+              return failureCount < 3;
+            },
           },
         },
       })
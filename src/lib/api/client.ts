@@ -9,25 +9,44 @@ import {
 
 const API_BASE = "/api";
 
+/**
+ * API 请求错误
+ * 携带 HTTP 状态码，便于调用方区分客户端错误与可重试的服务端错误
+ */
+export class ApiError extends Error {
+  readonly status: number;
+
+  constructor(message: string, status: number) {
+    super(message);
+    this.name = "ApiError";
+    this.status = status;
+  }
+}
+
 /**
  * 通用 API 请求函数
  */
 async function fetchApi<T>(endpoint: string, options?: RequestInit): Promise<ApiResponse<T>> {
   const response = await fetch(`${API_BASE}${endpoint}`, {
+    ...options,
     headers: {
       "Content-Type": "application/json",
       ...options?.headers,
     },
-    ...options,
   });
 
-  const data = await response.json();
-
   if (!response.ok) {
-    throw new Error(data.error || "请求失败");
+    // 服务端错误格式为 { error: { code, message } }；代理返回的 HTML 等非 JSON 内容无法解析，使用默认提示
+    const data = await response.json().catch(() => null);
+    throw new ApiError(data?.error?.message || "请求失败", response.status);
+  }
+
+  // 204 No Content（如删除操作）没有响应体
+  if (response.status === 204) {
+    return { success: true };
   }
 
-  return data;
+  return response.json();
 }
 
 // ============================================================================
@@ -143,7 +162,12 @@ export interface Stats {
 
 /**
  * 获取系统统计信息
+ * 通过请求头传递用户时区偏移量（分钟），服务端据此计算"今日新增"
  */
 export async function getStats(): Promise<ApiResponse<Stats>> {
-  return fetchApi<Stats>("/stats");
+  return fetchApi<Stats>("/stats", {
+    headers: {
+      "x-timezone-offset": String(new Date().getTimezoneOffset()),
+    },
+  });
 }
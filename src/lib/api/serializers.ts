@@ -0,0 +1,41 @@
+/**
+ * API 数据序列化工具
+ * 将数据库记录转换为统一的响应格式
+ */
+
+import type { Subreddit } from "@/lib/db/schema";
+
+/**
+ * 将 Subreddit 记录转换为响应格式
+ */
+export function toSubredditResponse(sub: Subreddit) {
+  return {
+    id: sub.id,
+    name: sub.name,
+    display_name: sub.displayName,
+    description: sub.description,
+    is_active: sub.isActive,
+    fetch_frequency: sub.fetchFrequency,
+    posts_limit: sub.postsLimit,
+    last_fetched_at: sub.lastFetchedAt,
+    created_at: sub.createdAt,
+    updated_at: sub.updatedAt,
+  };
+}
+
+/**
+ * 解析以 JSON 字符串存储的字段
+ * 首字符不是 [ 或 { 时直接返回 null，避免对非法内容调用 JSON.parse 并抛出异常
+ */
+export function parseJsonField<T = string[]>(field: string | null): T | null {
+  if (!field) return null;
+
+  const firstChar = field.trimStart().charAt(0);
+  if (firstChar !== "[" && firstChar !== "{") return null;
+
+  try {
+    return JSON.parse(field) as T;
+  } catch {
+    return null;
+  }
+}
@@ -0,0 +1,30 @@
+/**
+ * API 参数校验工具
+ */
+
+import { subreddits, type Subreddit } from "@/lib/db/schema";
+import { ApiErrors } from "@/lib/api/response";
+
+type FetchFrequency = Subreddit["fetchFrequency"];
+
+// 允许的抓取频率，直接取自 schema 中的枚举定义（模块加载时构建一次）
+const FETCH_FREQUENCIES = new Set<string>(subreddits.fetchFrequency.enumValues);
+
+/**
+ * 判断是否为有效的抓取频率
+ */
+export function isValidFetchFrequency(value: unknown): value is FetchFrequency {
+  return typeof value === "string" && FETCH_FREQUENCIES.has(value);
+}
+
+/**
+ * 抓取频率无效时的错误响应
+ */
+export function invalidFetchFrequencyError() {
+  return ApiErrors.validationError("无效的抓取频率", [
+    {
+      field: "fetch_frequency",
+      message: `必须是 ${subreddits.fetchFrequency.enumValues.join(", ")} 之一`,
+    },
+  ]);
+}
@@ -0,0 +1,60 @@
+/**
+ * 进程内 TTL 缓存
+ * 用于缓存读多写少的查询结果，减少对远程数据库的重复访问
+ */
+
+interface CacheEntry<T> {
+  value: Promise<T>;
+  expiresAt: number;
+}
+
+const store = new Map<string, CacheEntry<unknown>>();
+
+// 统计数据缓存键前缀（完整键为 stats:<今天起始时间>）
+export const STATS_CACHE_PREFIX = "stats:";
+
+// 行业、痛点类型等参考数据极少变化，缓存 5 分钟
+export const REFERENCE_DATA_TTL = 5 * 60 * 1000;
+
+/**
+ * 读取缓存，未命中或已过期时调用 loader 加载并写入缓存
+ * 缓存的是 Promise，因此并发请求会共享同一次加载
+ */
+export function cached<T>(key: string, ttlMs: number, loader: () => Promise<T>): Promise<T> {
+  const now = Date.now();
+  const entry = store.get(key) as CacheEntry<T> | undefined;
+
+  if (entry && entry.expiresAt > now) {
+    return entry.value;
+  }
+
+  // 写入前清理已过期的条目，避免不再访问的键一直占用内存
+  for (const [cachedKey, cachedEntry] of store) {
+    if (cachedEntry.expiresAt <= now) {
+      store.delete(cachedKey);
+    }
+  }
+
+  const value = loader();
+  store.set(key, { value, expiresAt: now + ttlMs });
+
+  // 加载失败时移除缓存，避免错误结果被复用
+  value.catch(() => {
+    if (store.get(key)?.value === value) {
+      store.delete(key);
+    }
+  });
+
+  return value;
+}
+
+/**
+ * 使以指定前缀开头的缓存失效（写操作后调用，避免返回过期数据）
+ */
+export function invalidateCache(prefix: string) {
+  for (const key of store.keys()) {
+    if (key.startsWith(prefix)) {
+      store.delete(key);
+    }
+  }
+}
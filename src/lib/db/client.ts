@@ -1,12 +1,19 @@
 import { drizzle } from "drizzle-orm/libsql";
-import { createClient } from "@libsql/client";
+import { createClient, type Client } from "@libsql/client";
 import * as schema from "./schema";
 
-// 创建 LibSQL 客户端
-const client = createClient({
-  url: process.env.TURSO_DATABASE_URL!,
-  authToken: process.env.TURSO_AUTH_TOKEN,
-});
+// 在 globalThis 上缓存客户端，避免热更新或多个路由包重复创建连接
+const globalForDb = globalThis as unknown as { libsqlClient?: Client };
+
+// 创建 LibSQL 客户端（同一进程内复用底层连接）
+const client =
+  globalForDb.libsqlClient ??
+  createClient({
+    url: process.env.TURSO_DATABASE_URL!,
+    authToken: process.env.TURSO_AUTH_TOKEN,
+  });
+
+globalForDb.libsqlClient = client;
 
 // 创建 Drizzle ORM 实例
 export const db = drizzle(client, { schema });
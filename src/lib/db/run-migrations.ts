@@ -0,0 +1,41 @@
+import type { Client } from "@libsql/client";
+import * as fs from "fs";
+import * as path from "path";
+
+/**
+ * 依次执行 drizzle 目录下的迁移文件
+ * 任一文件执行失败时抛出异常并停止，后续文件不会执行
+ * 供 migrate.ts 与 reset.ts 脚本共用
+ */
+export async function runMigrations(client: Client) {
+  // 读取迁移文件
+  const migrationsDir = path.join(process.cwd(), "drizzle");
+  const files = fs
+    .readdirSync(migrationsDir)
+    .filter((f) => f.endsWith(".sql"))
+    .sort();
+
+  for (const file of files) {
+    console.log(`📄 执行迁移: ${file}`);
+    const sqlContent = fs.readFileSync(path.join(migrationsDir, file), "utf-8");
+
+    // 分割语句 (使用 --> statement-breakpoint 作为分隔符)
+    const statements = sqlContent
+      .split("--> statement-breakpoint")
+      .map((s) => s.trim())
+      .filter((s) => s.length > 0);
+
+    try {
+      // 同一文件的语句在一个事务中执行，失败时整体回滚
+      await client.batch(statements, "write");
+      console.log(`  ✓ 执行成功（${statements.length} 条语句）`);
+    } catch (error: unknown) {
+      // 忽略 "table already exists" 错误
+      const errorMessage = error instanceof Error ? error.message : String(error);
+      if (!errorMessage.includes("already exists")) {
+        throw new Error(`迁移 ${file} 执行失败: ${errorMessage}`);
+      }
+      console.log(`  ⚠ 表已存在，跳过该文件`);
+    }
+  }
+}
@@ -0,0 +1,17 @@
+import { createClient } from "@libsql/client";
+import { drizzle } from "drizzle-orm/libsql";
+import { config } from "dotenv";
+import * as schema from "./schema";
+
+// 命令行脚本不经过 Next.js，需要手动加载环境变量
+config({ path: ".env.local" });
+
+/**
+ * 命令行脚本（migrate / reset / seed / verify）共用的数据库客户端
+ */
+export const client = createClient({
+  url: process.env.TURSO_DATABASE_URL!,
+  authToken: process.env.TURSO_AUTH_TOKEN,
+});
+
+export const db = drizzle(client, { schema });
@@ -1,19 +1,6 @@
-import { createClient } from "@libsql/client";
-import { drizzle } from "drizzle-orm/libsql";
 import { v4 as uuidv4 } from "uuid";
-import { config } from "dotenv";
 import * as schema from "./schema";
-
-// 加载环境变量
-config({ path: ".env.local" });
-
-// 从环境变量获取数据库配置
-const client = createClient({
-  url: process.env.TURSO_DATABASE_URL!,
-  authToken: process.env.TURSO_AUTH_TOKEN,
-});
-
-const db = drizzle(client, { schema });
+import { db } from "./script-client";
 
 /**
  * 行业分类初始数据 - 中文名称
@@ -122,25 +109,20 @@ async function seed() {
   console.log("🌱 开始填充基础数据...");
 
   try {
+    // 每类数据使用一条多行 INSERT 写入，避免逐行往返
     // 填充行业分类
     console.log("📦 填充行业分类数据...");
-    for (const industry of industriesData) {
-      await db.insert(schema.industries).values(industry).onConflictDoNothing();
-    }
+    await db.insert(schema.industries).values(industriesData).onConflictDoNothing();
     console.log(`✅ 已填充 ${industriesData.length} 个行业分类`);
 
     // 填充痛点类型
     console.log("📦 填充痛点类型数据...");
-    for (const type of painPointTypesData) {
-      await db.insert(schema.painPointTypes).values(type).onConflictDoNothing();
-    }
+    await db.insert(schema.painPointTypes).values(painPointTypesData).onConflictDoNothing();
     console.log(`✅ 已填充 ${painPointTypesData.length} 个痛点类型`);
 
     // 填充 Subreddit 配置
     console.log("📦 填充 Subreddit 配置...");
-    for (const subreddit of subredditsData) {
-      await db.insert(schema.subreddits).values(subreddit).onConflictDoNothing();
-    }
+    await db.insert(schema.subreddits).values(subredditsData).onConflictDoNothing();
     console.log(`✅ 已填充 ${subredditsData.length} 个 Subreddit 配置`);
 
     console.log("🎉 基础数据填充完成！");
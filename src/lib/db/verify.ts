@@ -1,17 +1,6 @@
-import { createClient } from "@libsql/client";
-import { drizzle } from "drizzle-orm/libsql";
-import { config } from "dotenv";
+import { sql } from "drizzle-orm";
 import * as schema from "./schema";
-
-// 加载环境变量
-config({ path: ".env.local" });
-
-const client = createClient({
-  url: process.env.TURSO_DATABASE_URL!,
-  authToken: process.env.TURSO_AUTH_TOKEN,
-});
-
-const db = drizzle(client, { schema });
+import { db } from "./script-client";
 
 async function verify() {
   console.log("🔍 验证数据库连接和数据...\n");
@@ -35,12 +24,14 @@ async function verify() {
     subreddits.forEach((s) => console.log(`   - r/${s.name} (${s.isActive ? "启用" : "禁用"})`));
     console.log("");
 
-    // 验证空表
-    const posts = await db.select().from(schema.posts);
-    console.log(`📭 帖子: ${posts.length} 条 (预期为空)`);
-
-    const painPoints = await db.select().from(schema.painPoints);
-    console.log(`📭 痛点: ${painPoints.length} 条 (预期为空)`);
+    // 验证空表（一次查询统计各表数量，不拉取整表数据）
+    const [emptyTables] = await db.all<{ posts: number; painPoints: number }>(sql`
+      SELECT
+        (SELECT count(*) FROM ${schema.posts}) AS posts,
+        (SELECT count(*) FROM ${schema.painPoints}) AS painPoints
+    `);
+    console.log(`📭 帖子: ${emptyTables.posts} 条 (预期为空)`);
+    console.log(`📭 痛点: ${emptyTables.painPoints} 条 (预期为空)`);
 
     console.log("\n🎉 数据库验证通过！所有基础数据已就绪。");
   } catch (error) {
@@ -4,3 +4,16 @@ import { twMerge } from "tailwind-merge";
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs));
 }
+
+// 匹配时间字符串末尾的时区偏移（如 +08:00）
+const TIMEZONE_OFFSET_REGEX = /[+-]\d{2}:\d{2}$/;
+
+/**
+ * 将时间字符串标准化为 UTC（如果没有时区信息）
+ */
+export function normalizeToUTC(dateString: string): Date {
+  if (dateString.endsWith("Z") || TIMEZONE_OFFSET_REGEX.test(dateString)) {
+    return new Date(dateString);
+  }
+  return new Date(dateString + "Z");
+}
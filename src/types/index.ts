@@ -136,7 +136,11 @@ export interface Subreddit {
 export interface ApiResponse<T> {
   success: boolean;
   data?: T;
-  error?: string;
+  error?: {
+    code: string;
+    message: string;
+    details?: Array<{ field: string; message: string }>;
+  };
   pagination?: {
     total: number;
     page: number;